@@ -6,8 +6,10 @@ CLI 메인 진입점
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+import pandas as pd
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
@@ -16,16 +18,22 @@ from rich.panel import Panel
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core import (
-    parse_policy_file, 
-    parse_target_file, 
-    validate_policy_changes, 
+    parse_policy_file,
+    parse_target_file,
+    validate_policy_changes,
     show_summary,
+    save_report,
+    excel_session,
+    cached_parse,
     PaloaltoParser,
     SECUIParser
 )
 
 console = Console()
 
+# 상세 트레이스백은 디버그 플래그를 켠 경우에만 출력 (반복 실패 시 로그 오염/비용 방지)
+_DEBUG = os.environ.get('VALIDATE_POLICY_DEBUG') == '1'
+
 
 def select_excel_files(current_dir: Path, file_type: str) -> list:
     """
@@ -38,9 +46,14 @@ def select_excel_files(current_dir: Path, file_type: str) -> list:
     Returns:
         List[str]: 선택된 파일 경로 리스트
     """
-    # Excel 파일 찾기
-    excel_files = sorted([f for f in os.listdir(current_dir) 
-                         if f.endswith(('.xlsx', '.xls')) and not f.startswith('~$')])
+    # Excel 파일 찾기 (scandir: 항목별 stat 없이 한 번의 순회로 필터링)
+    with os.scandir(current_dir) as entries:
+        excel_files = sorted(
+            e.name for e in entries
+            if e.is_file(follow_symlinks=False)
+            and e.name.endswith(('.xlsx', '.xls'))
+            and not e.name.startswith('~$')
+        )
     
     if not excel_files:
         console.print(f"[yellow]현재 디렉터리에 Excel 파일이 없습니다.[/yellow]")
@@ -261,55 +274,69 @@ def main():
     console.print("[bold]4단계: 정책 파일 파싱[/bold]")
     console.print("="*70)
     
-    try:
-        console.print(f"\n[cyan]Running 정책 파싱 중...[/cyan]")
-        if vendor == "SECUI":
-            running_policy_data = SECUIParser.parse_policy_file(
-                str(current_dir / running_file), 
-                running_sheet
-            )
-        else:
-            running_policy_data = PaloaltoParser.parse_policy_file(
-                str(current_dir / running_file)
-            )
-        console.print(f"[green]✓ 총 {len(running_policy_data)}개 정책 발견[/green]")
-        
-        console.print(f"\n[cyan]Candidate 정책 파싱 중...[/cyan]")
-        if vendor == "SECUI":
-            candidate_policy_data = SECUIParser.parse_policy_file(
-                str(current_dir / candidate_file),
-                candidate_sheet
-            )
-        else:
-            candidate_policy_data = PaloaltoParser.parse_policy_file(
-                str(current_dir / candidate_file)
-            )
-        console.print(f"[green]✓ 총 {len(candidate_policy_data)}개 정책 발견[/green]")
-    except Exception as e:
-        console.print(f"[red]파싱 오류: {e}[/red]")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    # Excel 폴백이 필요한 파일이 여러 개여도 Excel 프로세스는 한 번만 기동
+    with excel_session():
+        try:
+            # 성능 최적화: Running/Candidate는 서로 독립이므로 스레드 2개로 병렬 파싱
+            # (openpyxl 읽기는 I/O 병목이라 스레드로도 겹쳐짐. 워커 프로세스는
+            # PyInstaller 빌드에서 spawn이 번들 실행 파일을 재실행해 사용 불가)
+            console.print(f"\n[cyan]Running/Candidate 정책 파싱 중... (병렬)[/cyan]")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                if vendor == "SECUI":
+                    fut_running = executor.submit(
+                        cached_parse, str(current_dir / running_file),
+                        SECUIParser.parse_policy_file, running_sheet
+                    )
+                    fut_candidate = executor.submit(
+                        cached_parse, str(current_dir / candidate_file),
+                        SECUIParser.parse_policy_file, candidate_sheet
+                    )
+                else:
+                    fut_running = executor.submit(
+                        cached_parse, str(current_dir / running_file),
+                        PaloaltoParser.parse_policy_file
+                    )
+                    fut_candidate = executor.submit(
+                        cached_parse, str(current_dir / candidate_file),
+                        PaloaltoParser.parse_policy_file
+                    )
+                running_policy_data = fut_running.result()
+                candidate_policy_data = fut_candidate.result()
+            console.print(f"[green]✓ Running: 총 {len(running_policy_data)}개 정책 발견[/green]")
+            console.print(f"[green]✓ Candidate: 총 {len(candidate_policy_data)}개 정책 발견[/green]")
+        except Exception as e:
+            console.print(f"[red]파싱 오류: {e}[/red]")
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
+            sys.exit(1)
     
-    # 5. 대상 정책 목록 로드
-    target_policies = []
-    if target_files:
-        console.print("\n" + "="*70)
-        console.print("[bold]5단계: 대상 정책 목록 로드[/bold]")
-        console.print("="*70)
+        # 5. 대상 정책 목록 로드
+        target_policies = []
+        if target_files:
+            console.print("\n" + "="*70)
+            console.print("[bold]5단계: 대상 정책 목록 로드[/bold]")
+            console.print("="*70)
         
-        for target_file in target_files:
-            try:
-                console.print(f"\n[cyan]대상 정책 파일 파싱 중: {target_file}[/cyan]")
-                policies = parse_target_file(str(current_dir / target_file))
-                target_policies.extend(policies)
-                console.print(f"[green]✓ {len(policies)}개 정책 발견[/green]")
-            except Exception as e:
-                console.print(f"[yellow]경고: {target_file} 파싱 실패 - {e}[/yellow]")
+            # openpyxl 빠른 경로는 스레드 안전하므로 대상 파일들을 병렬 파싱
+            # (결과는 파일 순서대로 합쳐 중복 제거 순서를 유지)
+            console.print(f"\n[cyan]{len(target_files)}개 대상 정책 파일 파싱 중...[/cyan]")
+            with ThreadPoolExecutor(max_workers=min(4, len(target_files))) as executor:
+                futures = [
+                    executor.submit(cached_parse, str(current_dir / f), parse_target_file)
+                    for f in target_files
+                ]
+            for target_file, future in zip(target_files, futures):
+                try:
+                    policies = future.result()
+                    target_policies.extend(policies)
+                    console.print(f"[green]✓ {target_file}: {len(policies)}개 정책 발견[/green]")
+                except Exception as e:
+                    console.print(f"[yellow]경고: {target_file} 파싱 실패 - {e}[/yellow]")
         
-        # 중복 제거
-        target_policies = list(dict.fromkeys(target_policies))
-        console.print(f"\n[green]✓ 총 {len(target_policies)}개 고유 대상 정책[/green]")
+            # 중복 제거 (순서 유지, C 레벨 해시테이블 사용)
+            target_policies = pd.unique(pd.Series(target_policies, dtype=object)).tolist()
+            console.print(f"\n[green]✓ 총 {len(target_policies)}개 고유 대상 정책[/green]")
     
     # 6. 정책 검증
     if len(target_policies) == 0:
@@ -343,13 +370,15 @@ def main():
             
             # 날짜+시간으로 파일명 중복 방지
             validation_report_file = current_dir / (datetime.now().strftime("%Y-%m-%d_%H%M%S") + "_validation_report.xlsx")
-            validation_results.to_excel(str(validation_report_file), index=False, engine='openpyxl')
+            # xlsxwriter 엔진으로 저장 (core.utils.save_report)
+            save_report(validation_results, str(validation_report_file))
             console.print(f"\n[green]✓ 검증 결과가 {validation_report_file.name}에 저장되었습니다.[/green]")
             console.print(f"[green]✓ 총 {len(validation_results)}개 정책 검증 완료[/green]")
         except Exception as e:
             console.print(f"[red]검증 오류: {e}[/red]")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
             sys.exit(1)
     
     console.print("\n" + "="*70)
@@ -2,18 +2,21 @@
 방화벽 정책 검증 핵심 모듈
 """
 
-from .parser import parse_policy_file, parse_target_file
+from .parser import parse_policy_file, parse_target_file, excel_session, cached_parse
 from .validator import validate_policy_changes, normalize_enable
-from .utils import show_summary, get_summary_dict
+from .utils import show_summary, get_summary_dict, save_report
 from .vendor import PaloaltoParser, SECUIParser
 
 __all__ = [
     'parse_policy_file',
     'parse_target_file',
+    'excel_session',
+    'cached_parse',
     'validate_policy_changes',
     'normalize_enable',
     'show_summary',
     'get_summary_dict',
+    'save_report',
     'PaloaltoParser',
     'SECUIParser'
 ]
@@ -4,102 +4,406 @@
 Excel 파일에서 정책 정보를 추출합니다.
 """
 
+import contextlib
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import openpyxl
 import xlwings as xw
 import pandas as pd
-from typing import List
+from typing import List, Optional, Tuple
+
+# 헤더/값 매칭용 상수 (O(1) 해시 조회, 호출마다 리스트를 새로 만들지 않음)
+_RULENAME_HEADERS = frozenset({'rule name', 'rulename', 'policy name'})
+_ENABLE_HEADERS = frozenset({'enable'})
+_TASK_HEADERS = frozenset({'작업구분', 'task type', 'tasktype', 'task'})
+_EXCLUSION_HEADERS = frozenset({'제외사유', 'exclusion reason', 'exclusionreason', 'reason', 'exclusion'})
+_DELETE_VALUES = frozenset({'삭제', 'delete'})
+
+# 대상 파일 헤더 문자열 -> 역할 매핑 (세 세트 멤버십 검사를 단일 dict 조회로 대체)
+_TARGET_HDR = {
+    **{h: 'rulename' for h in _RULENAME_HEADERS},
+    **{h: 'task' for h in _TASK_HEADERS},
+    **{h: 'exclusion' for h in _EXCLUSION_HEADERS},
+}
+
+
+def _as_2d_block(values, num_rows: int) -> list:
+    """
+    xlwings 범위 읽기 결과를 2차원 리스트로 통일합니다.
+
+    xlwings는 단일 셀이면 스칼라, 단일 행/열이면 1차원 리스트를 반환하므로
+    행 수를 기준으로 방향을 구분해 항상 list-of-lists 형태로 변환합니다.
+    """
+    if values is None:
+        return []
+    if not isinstance(values, list):
+        return [[values]]
+    if values and not isinstance(values[0], (list, tuple)):
+        # 1차원 리스트: 행이 하나면 가로 방향, 아니면 세로 방향(단일 컬럼)
+        if num_rows == 1:
+            return [values]
+        return [[v] for v in values]
+    return values
+
+
+def _normalize_column(values) -> np.ndarray:
+    """
+    xlwings 컬럼 읽기 결과(단일 값/1D/2D)를 1차원 object 배열로 통일합니다.
+
+    파이썬 컴프리헨션 대신 numpy의 C 레벨 reshape를 사용해
+    행 수에 비례하는 파이썬 루프를 제거합니다.
+    """
+    if values is None:
+        return np.empty(0, dtype=object)
+    arr = np.asarray(values, dtype=object)
+    if arr.ndim == 0:
+        arr = arr.reshape(1)
+    elif arr.ndim == 2:
+        # 단일 컬럼 2D 반환 → 첫 번째 열만 사용
+        arr = arr[:, 0]
+    return arr
+
+
+# 파싱 결과 캐시 디렉터리 ((경로, 수정시각, 크기) 키 → pickle 사이드카)
+_CACHE_DIR = Path.home() / '.cache' / 'validate_policy'
+
+
+def cached_parse(file_path: str, parse_fn, *args):
+    """
+    (경로, 수정시각, 크기) 키로 파싱 결과를 캐시합니다.
+
+    같은 파일을 반복 검증하는 경우 Excel/openpyxl 파싱을 건너뛰고 저장된
+    결과를 바로 읽습니다. 캐시 읽기/쓰기에 실패하면 조용히 일반 파싱으로
+    폴백합니다.
+
+    Args:
+        file_path (str): 파싱할 파일 경로
+        parse_fn: file_path를 첫 인자로 받는 파싱 함수
+        *args: parse_fn에 전달할 추가 인자 (캐시 키에 포함됨, 예: 시트명)
+    """
+    cache_path = None
+    try:
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{args!r}"
+        cache_path = _CACHE_DIR / (hashlib.sha1(key.encode('utf-8')).hexdigest() + '.pkl')
+        if cache_path.exists():
+            return pd.read_pickle(cache_path)
+    except Exception:
+        cache_path = None
+
+    result = parse_fn(file_path, *args)
+
+    if cache_path is not None:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            pd.to_pickle(result, cache_path)
+        except Exception:
+            pass
+
+    return result
+
+
+# excel_session() 안에서 재사용되는 공유 Excel 프로세스 (지연 생성)
+# 파싱이 스레드 풀에서 돌므로 생성/사용/종료는 _session_lock으로 직렬화
+# (xlwings 객체는 스레드 간 공유를 지원하지 않음)
+_session_app = None
+_session_depth = 0
+_session_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def excel_session():
+    """
+    여러 파일을 파싱하는 동안 Excel 프로세스를 하나만 띄워 재사용합니다.
+
+    파일마다 Excel을 기동/종료하면 파일당 수 초의 오버헤드가 발생하므로,
+    배치 파싱 구간을 이 컨텍스트로 감싸면 xlwings 폴백이 처음 필요해질 때
+    한 번만 Excel을 띄우고 컨텍스트 종료 시 정리합니다. openpyxl 빠른
+    경로만 사용된 경우 Excel은 아예 실행되지 않습니다.
+    """
+    global _session_app, _session_depth
+    _session_depth += 1
+    try:
+        yield
+    finally:
+        _session_depth -= 1
+        if _session_depth == 0:
+            with _session_lock:
+                if _session_app is not None:
+                    app, _session_app = _session_app, None
+                    try:
+                        app.quit()
+                    except Exception:
+                        pass
+
+
+def _configure_app(app) -> None:
+    """
+    읽기 전용 파싱에 불필요한 Excel 동작(재계산/이벤트/경고/화면 갱신)을 끕니다.
+
+    COM 속성이므로 Windows가 아닌 환경이나 일부 Excel 버전에서는 실패할 수
+    있어 실패는 무시합니다. 앱은 항상 이 모듈이 띄운 비가시 인스턴스이므로
+    종료 시 복원할 필요가 없습니다.
+    """
+    try:
+        app.api.Calculation = -4135  # xlCalculationManual
+        app.api.EnableEvents = False
+        app.api.DisplayAlerts = False
+        app.api.ScreenUpdating = False
+    except Exception:
+        pass
+
+
+def _open_readonly(app, file_path: str):
+    """링크 갱신 없이 읽기 전용으로 워크북을 엽니다. (구버전 xlwings 호환 폴백 포함)"""
+    try:
+        return app.books.open(file_path, update_links=False, read_only=True)
+    except TypeError:
+        return app.books.open(file_path)
+
+
+@contextlib.contextmanager
+def _open_workbook(file_path: str):
+    """
+    xlwings로 워크북을 엽니다.
+
+    excel_session() 안이면 공유 App을 재사용하고, 아니면 기존처럼
+    일회용 App을 만들어 사용 후 종료합니다.
+    """
+    global _session_app
+    if _session_depth > 0:
+        # 공유 App은 스레드 간 동시 사용이 불가하므로 생성부터 닫기까지 락으로
+        # 직렬화 (스레드 풀에서 여러 파일이 동시에 폴백에 진입해도 Excel
+        # 프로세스는 하나만 생성되고 한 번에 한 워크북만 구동됨)
+        with _session_lock:
+            if _session_app is None:
+                _session_app = xw.App(visible=False, add_book=False)
+                _configure_app(_session_app)
+            wb = _open_readonly(_session_app, file_path)
+            try:
+                yield wb
+            finally:
+                wb.close()
+    else:
+        with xw.App(visible=False) as app:
+            _configure_app(app)
+            wb = _open_readonly(app, file_path)
+            try:
+                yield wb
+            finally:
+                wb.close()
+
+
+def _scan_policy_rows(rows, file_path: str) -> Tuple[list, list]:
+    """
+    행 iterable에서 'Rulename'/'Enable' 헤더를 찾아 두 컬럼 값을 추출합니다.
+
+    openpyxl/xlrd/calamine 네이티브 리더가 공유하는 스캔 로직입니다.
+    헤더는 첫 50행, 최대 200열에서 찾습니다.
+
+    Returns:
+        (rulename_values, enable_values)
+    """
+    header_row_idx = None
+    rulename_col_idx = None
+    enable_col_idx = None
+
+    rulename_values = []
+    enable_values = []
+
+    for row_idx, row in enumerate(rows, 1):
+        if header_row_idx is None:
+            # 헤더 행 찾기 (첫 50행, 최대 200열)
+            if row_idx > 50:
+                break
+            for col_idx, cell_value in enumerate(row[:200], 1):
+                # 헤더는 문자열이므로 숫자/None 셀은 건너뛰기
+                if isinstance(cell_value, str) and cell_value:
+                    cell_str = cell_value.strip().lower()
+                    if cell_str == 'rulename' and rulename_col_idx is None:
+                        rulename_col_idx = col_idx
+                    elif cell_str == 'enable' and enable_col_idx is None:
+                        enable_col_idx = col_idx
+                if rulename_col_idx is not None and enable_col_idx is not None:
+                    break
+            if rulename_col_idx is not None and enable_col_idx is not None:
+                header_row_idx = row_idx
+        else:
+            # 헤더 이후 데이터 행: 필요한 두 컬럼만 추출
+            rulename_values.append(row[rulename_col_idx - 1] if rulename_col_idx <= len(row) else None)
+            enable_values.append(row[enable_col_idx - 1] if enable_col_idx <= len(row) else None)
+
+    if header_row_idx is None or rulename_col_idx is None or enable_col_idx is None:
+        raise ValueError(f"'{file_path}'에서 'Rulename'과 'Enable' 컬럼을 찾을 수 없습니다.")
+
+    return rulename_values, enable_values
+
+
+def _read_policy_columns_openpyxl(file_path: str) -> Tuple[list, list]:
+    """
+    openpyxl read_only 모드로 'Rulename'/'Enable' 컬럼 값을 읽습니다. (Excel 실행 없이 동작)
+
+    Returns:
+        (rulename_values, enable_values)
+    """
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return _scan_policy_rows(wb.worksheets[0].iter_rows(values_only=True), file_path)
+    finally:
+        wb.close()
+
+
+def _read_policy_columns_calamine(file_path: str) -> Tuple[list, list]:
+    """
+    python-calamine(Rust 엔진)으로 'Rulename'/'Enable' 컬럼 값을 읽습니다.
+
+    openpyxl보다 수 배 빠른 선택적 빠른 경로입니다. 미설치 시 ImportError가
+    발생하고 호출부에서 openpyxl로 폴백합니다. (빈 셀은 ''로 반환됨)
+    """
+    from python_calamine import CalamineWorkbook  # 선택 의존성
+
+    rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python()
+    return _scan_policy_rows(rows, file_path)
+
+
+def _read_policy_columns_xlrd(file_path: str) -> Tuple[list, list]:
+    """
+    xlrd로 .xls(BIFF) 파일의 'Rulename'/'Enable' 컬럼 값을 읽습니다. (Excel 실행 없이 동작)
+
+    openpyxl은 .xlsx(ZIP/XML)만 지원하므로 .xls는 xlrd로 직접 읽습니다.
+    on_demand 모드로 첫 시트만 로드합니다.
+    """
+    import xlrd  # 선택 의존성: .xls 파일을 파싱할 때만 필요
+
+    wb = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        sh = wb.sheet_by_index(0)
+        rows = (sh.row_values(i) for i in range(sh.nrows))
+        return _scan_policy_rows(rows, file_path)
+    finally:
+        wb.release_resources()
+
+
+def _read_policy_columns_xlwings(file_path: str) -> Tuple[list, list]:
+    """
+    xlwings(Excel)로 'Rulename'/'Enable' 컬럼 값을 읽습니다. (DRM 보호 파일 등 openpyxl 실패 시 폴백)
+    """
+    with _open_workbook(file_path) as wb:
+        ws = wb.sheets[0]
+
+        # 사용된 범위 가져오기
+        if not ws.used_range:
+            return [], []
+
+        # 실제 사용된 마지막 행과 열 가져오기 (제한 없음)
+        max_row = ws.used_range.last_cell.row
+        max_col = ws.used_range.last_cell.column
+
+        # 헤더 행 찾기: 'Rulename'과 'Enable' 컬럼이 있는 행 찾기
+        header_row_idx = None
+        rulename_col_idx = None
+        enable_col_idx = None
+
+        # 성능 최적화: 헤더 탐색 범위 전체를 COM 호출 한 번으로 읽은 뒤 메모리에서 스캔
+        # (셀 단위 읽기는 셀마다 COM 왕복이 발생하여 최대 50x200 = 10,000회 호출)
+        search_rows = min(50, max_row)
+        search_cols = min(max_col, 200)  # 최대 200열까지 검색
+        header_block = _as_2d_block(ws.range((1, 1), (search_rows, search_cols)).value, search_rows)
+
+        for row_idx, row in enumerate(header_block, 1):
+            for col_idx, cell_value in enumerate(row, 1):
+                # 헤더는 문자열이므로 숫자/None 셀은 건너뛰기
+                if isinstance(cell_value, str) and cell_value:
+                    cell_str = cell_value.strip().lower()
+                    if cell_str == 'rulename' and rulename_col_idx is None:
+                        rulename_col_idx = col_idx
+                    elif cell_str == 'enable' and enable_col_idx is None:
+                        enable_col_idx = col_idx
+
+                # 두 컬럼을 모두 찾았으면 남은 셀은 확인하지 않음
+                if rulename_col_idx is not None and enable_col_idx is not None:
+                    break
+
+            # 두 컬럼을 모두 찾으면 헤더 행으로 설정
+            if rulename_col_idx is not None and enable_col_idx is not None:
+                header_row_idx = row_idx
+                break
+
+        if header_row_idx is None or rulename_col_idx is None or enable_col_idx is None:
+            raise ValueError(f"'{file_path}'에서 'Rulename'과 'Enable' 컬럼을 찾을 수 없습니다.")
+
+        # 헤더 행 이후부터 마지막 행까지 Rulename과 Enable 컬럼만 읽기
+        data_start_row = header_row_idx + 1
+        data_end_row = max_row
+
+        # 데이터가 있는 경우에만 읽기
+        if data_start_row <= data_end_row:
+            # 성능 최적화: 두 컬럼을 개별로 읽으면 COM 왕복이 2번 발생하므로
+            # 두 컬럼을 포함하는 사각형 범위를 한 번에 읽고 파이썬에서 슬라이스
+            lo = min(rulename_col_idx, enable_col_idx)
+            hi = max(rulename_col_idx, enable_col_idx)
+            data_block = _as_2d_block(
+                ws.range((data_start_row, lo), (data_end_row, hi)).value,
+                data_end_row - data_start_row + 1
+            )
+
+            rulename_values = [row[rulename_col_idx - lo] for row in data_block]
+            enable_values = [row[enable_col_idx - lo] for row in data_block]
+        else:
+            # 데이터가 없는 경우 빈 리스트
+            rulename_values = []
+            enable_values = []
+
+    return rulename_values, enable_values
 
 
 def parse_policy_file(file_path: str) -> pd.DataFrame:
     """
     방화벽 정책 Excel 파일을 파싱하여 'Rulename'과 'Enable' 컬럼을 추출합니다.
-    
-    성능 최적화: 전체 범위를 한 번에 읽어서 처리합니다.
-    빈 셀이 많은 파일에서도 'Rulename'과 'Enable'을 정확히 추출합니다.
-    
+
+    성능 최적화: 확장자에 따라 네이티브 파서로 직접 읽고 (.xlsx → openpyxl
+    read_only, .xls → xlrd, Excel 실행 없음), DRM 보호 파일 등 네이티브
+    파서가 열지 못하는 경우에만 xlwings로 폴백합니다. 빈 셀이 많은
+    파일에서도 'Rulename'과 'Enable'을 정확히 추출합니다.
+
     Args:
         file_path (str): Excel 파일 경로
-    
+
     Returns:
         pd.DataFrame: 'Rulename'과 'Enable' 컬럼을 가진 DataFrame
                      (중복 제거 및 공백 제거 완료)
     """
     try:
-        # xlwings로 Excel 파일 열기
-        with xw.App(visible=False) as app:
-            wb = app.books.open(file_path)
-            ws = wb.sheets[0]
-            
-            # 사용된 범위 가져오기
-            if not ws.used_range:
-                wb.close()
-                return pd.DataFrame(columns=['Rulename', 'Enable'])
-            
-            # 실제 사용된 마지막 행과 열 가져오기 (제한 없음)
-            max_row = ws.used_range.last_cell.row
-            max_col = ws.used_range.last_cell.column
-            
-            # 헤더 행 찾기: 'Rulename'과 'Enable' 컬럼이 있는 행 찾기
-            # 첫 50행에서 헤더 찾기 (충분한 범위)
-            header_row_idx = None
-            rulename_col_idx = None
-            enable_col_idx = None
-            
-            search_rows = min(50, max_row)
-            for row_idx in range(1, search_rows + 1):
-                for col_idx in range(1, min(max_col + 1, 200)):  # 최대 200열까지 검색
-                    cell_value = ws.range((row_idx, col_idx)).value
-                    if cell_value:
-                        cell_str = str(cell_value).strip().lower()
-                        if cell_str == 'rulename' and rulename_col_idx is None:
-                            rulename_col_idx = col_idx
-                        elif cell_str == 'enable' and enable_col_idx is None:
-                            enable_col_idx = col_idx
-                
-                # 두 컬럼을 모두 찾으면 헤더 행으로 설정
-                if rulename_col_idx is not None and enable_col_idx is not None:
-                    header_row_idx = row_idx
-                    break
-            
-            if header_row_idx is None or rulename_col_idx is None or enable_col_idx is None:
-                wb.close()
-                raise ValueError(f"'{file_path}'에서 'Rulename'과 'Enable' 컬럼을 찾을 수 없습니다.")
-            
-            # 헤더 행 이후부터 마지막 행까지 Rulename과 Enable 컬럼만 읽기
-            # 성능 최적화: 필요한 두 컬럼만 직접 읽기
-            data_start_row = header_row_idx + 1
-            data_end_row = max_row
-            
-            # 데이터가 있는 경우에만 읽기
-            if data_start_row <= data_end_row:
-                # Rulename 컬럼 읽기 (헤더 행 다음부터 끝까지)
-                rulename_range = ws.range((data_start_row, rulename_col_idx), (data_end_row, rulename_col_idx))
-                rulename_values = rulename_range.value
-                
-                # Enable 컬럼 읽기 (헤더 행 다음부터 끝까지)
-                enable_range = ws.range((data_start_row, enable_col_idx), (data_end_row, enable_col_idx))
-                enable_values = enable_range.value
-            else:
-                # 데이터가 없는 경우 빈 리스트
-                rulename_values = []
-                enable_values = []
-            
-            wb.close()
-        
-        # 리스트로 변환 (xlwings 반환값 처리)
-        # xlwings는 단일 셀을 읽으면 단일 값, 여러 셀을 읽으면 리스트 또는 2D 배열로 반환
-        def normalize_values(values):
-            if values is None:
-                return []
-            elif not isinstance(values, list):
-                return [values]
-            elif len(values) > 0 and isinstance(values[0], list):
-                # 2D 배열인 경우 첫 번째 요소만 추출 (단일 컬럼이므로)
-                return [row[0] if row else None for row in values]
+        ext = os.path.splitext(file_path)[1].lower()
+        try:
+            native_readable = True
+            if ext == '.xls':
+                columns = _read_policy_columns_xlrd(file_path)
             else:
-                return values
-        
-        rulename_values = normalize_values(rulename_values)
-        enable_values = normalize_values(enable_values)
+                # calamine(Rust)이 설치돼 있으면 최우선 사용, 아니면 openpyxl
+                try:
+                    columns = _read_policy_columns_calamine(file_path)
+                except ValueError:
+                    raise
+                except Exception:
+                    columns = _read_policy_columns_openpyxl(file_path)
+        except ValueError:
+            raise
+        except Exception:
+            native_readable = False
+
+        if not native_readable:
+            columns = _read_policy_columns_xlwings(file_path)
+
+        rulename_values, enable_values = columns
+
+        # 1차원 배열로 통일 (xlwings 반환값 처리, numpy C 레벨 reshape)
+        rulename_values = _normalize_column(rulename_values)
+        enable_values = _normalize_column(enable_values)
         
         # 길이가 다른 경우 짧은 쪽에 맞춤
         min_len = min(len(rulename_values), len(enable_values))
@@ -108,165 +412,288 @@ def parse_policy_file(file_path: str) -> pd.DataFrame:
         if len(enable_values) > min_len:
             enable_values = enable_values[:min_len]
         
-        # DataFrame 생성
+        # DataFrame 생성 후 문자열 변환/공백 제거를 pandas C 커널로 일괄 처리
         df_filtered = pd.DataFrame({
             'Rulename': rulename_values,
             'Enable': enable_values
         })
-        
-        # 문자열로 변환하고 공백 제거
-        df_filtered['Rulename'] = df_filtered['Rulename'].fillna('').astype(str).str.strip()
-        df_filtered['Enable'] = df_filtered['Enable'].fillna('').astype(str).str.strip()
-        
+        df_filtered = df_filtered.fillna('').astype(str)
+        df_filtered['Rulename'] = df_filtered['Rulename'].str.strip()
+        df_filtered['Enable'] = df_filtered['Enable'].str.strip()
+
         # 빈 행 제거 (두 컬럼이 모두 비어있는 경우)
         df_filtered = df_filtered[
             ~((df_filtered['Rulename'] == '') & (df_filtered['Enable'] == ''))
         ]
         
-        # 중복 제거
-        df_processed = df_filtered.drop_duplicates().reset_index(drop=True)
-        
+        # 중복 제거: Rulename이 비교 키이므로 Rulename만 해시
+        # (검증 단계의 '마지막 행 우선' 동작과 맞춰 keep='last')
+        df_processed = df_filtered.drop_duplicates(subset='Rulename', keep='last', ignore_index=True)
+
         return df_processed
     
     except Exception as e:
         raise ValueError(f"파일 파싱 오류 ({file_path}): {e}")
 
 
+def _scan_target_rows(rows, file_path: str) -> Tuple[list, Optional[list], Optional[list]]:
+    """
+    행 iterable에서 대상 파일 헤더를 찾아 필요한 컬럼 값을 추출합니다.
+
+    openpyxl/xlrd/calamine 네이티브 리더가 공유하는 스캔 로직입니다.
+    헤더는 첫 50행, 최대 200열에서 찾습니다.
+
+    Returns:
+        (rulename_values, task_type_values, exclusion_reason_values)
+        작업구분/제외사유 컬럼이 없으면 해당 값은 None
+    """
+    header_row_idx = None
+    rulename_col_idx = None
+    task_type_col_idx = None
+    exclusion_reason_col_idx = None
+
+    rulename_values = []
+    task_type_values = []
+    exclusion_reason_values = []
+
+    for row_idx, row in enumerate(rows, 1):
+        if header_row_idx is None:
+            # 헤더 행 찾기 (첫 50행, 최대 200열)
+            if row_idx > 50:
+                break
+            for col_idx, cell_value in enumerate(row[:200], 1):
+                # 헤더는 문자열이므로 숫자/None 셀은 조회 없이 건너뛰기
+                if not isinstance(cell_value, str) or not cell_value:
+                    continue
+                role = _TARGET_HDR.get(cell_value.strip().lower())
+                if role == 'rulename':
+                    if rulename_col_idx is None:
+                        rulename_col_idx = col_idx
+                elif role == 'task':
+                    if task_type_col_idx is None:
+                        task_type_col_idx = col_idx
+                elif role == 'exclusion':
+                    if exclusion_reason_col_idx is None:
+                        exclusion_reason_col_idx = col_idx
+            if rulename_col_idx is not None:
+                header_row_idx = row_idx
+        else:
+            # 헤더 이후 데이터 행: 필요한 컬럼만 추출
+            rulename_values.append(row[rulename_col_idx - 1] if rulename_col_idx <= len(row) else None)
+            if task_type_col_idx is not None:
+                task_type_values.append(row[task_type_col_idx - 1] if task_type_col_idx <= len(row) else None)
+            if exclusion_reason_col_idx is not None:
+                exclusion_reason_values.append(row[exclusion_reason_col_idx - 1] if exclusion_reason_col_idx <= len(row) else None)
+
+    if header_row_idx is None or rulename_col_idx is None:
+        raise ValueError(f"'{file_path}'에서 정책 이름 컬럼('Rule Name', 'Rulename', 또는 'Policy Name')을 찾을 수 없습니다.")
+
+    return (
+        rulename_values,
+        task_type_values if task_type_col_idx is not None else None,
+        exclusion_reason_values if exclusion_reason_col_idx is not None else None,
+    )
+
+
+def _read_target_columns_openpyxl(file_path: str) -> Tuple[list, Optional[list], Optional[list]]:
+    """
+    openpyxl read_only 모드로 대상 파일의 컬럼 값을 읽습니다. (Excel 실행 없이 동작)
+
+    Returns:
+        (rulename_values, task_type_values, exclusion_reason_values)
+        작업구분/제외사유 컬럼이 없으면 해당 값은 None
+    """
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return _scan_target_rows(wb.worksheets[0].iter_rows(values_only=True), file_path)
+    finally:
+        wb.close()
+
+
+def _read_target_columns_calamine(file_path: str) -> Tuple[list, Optional[list], Optional[list]]:
+    """
+    python-calamine(Rust 엔진)으로 대상 파일의 컬럼 값을 읽습니다.
+
+    openpyxl보다 수 배 빠른 선택적 빠른 경로입니다. 미설치 시 ImportError가
+    발생하고 호출부에서 openpyxl로 폴백합니다. (빈 셀은 ''로 반환됨)
+    """
+    from python_calamine import CalamineWorkbook  # 선택 의존성
+
+    rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python()
+    return _scan_target_rows(rows, file_path)
+
+
+def _read_target_columns_xlrd(file_path: str) -> Tuple[list, Optional[list], Optional[list]]:
+    """
+    xlrd로 .xls(BIFF) 대상 파일의 컬럼 값을 읽습니다. (Excel 실행 없이 동작)
+
+    Returns:
+        (rulename_values, task_type_values, exclusion_reason_values)
+        작업구분/제외사유 컬럼이 없으면 해당 값은 None
+    """
+    import xlrd  # 선택 의존성: .xls 파일을 파싱할 때만 필요
+
+    wb = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        sh = wb.sheet_by_index(0)
+        rows = (sh.row_values(i) for i in range(sh.nrows))
+        return _scan_target_rows(rows, file_path)
+    finally:
+        wb.release_resources()
+
+
+def _read_target_columns_xlwings(file_path: str) -> Tuple[list, Optional[list], Optional[list]]:
+    """
+    xlwings(Excel)로 대상 파일의 컬럼 값을 읽습니다. (DRM 보호 파일 등 openpyxl 실패 시 폴백)
+    """
+    with _open_workbook(file_path) as wb:
+        ws = wb.sheets[0]
+
+        # 사용된 범위 가져오기
+        if not ws.used_range:
+            return [], None, None
+
+        # 실제 사용된 마지막 행과 열 가져오기
+        max_row = ws.used_range.last_cell.row
+        max_col = ws.used_range.last_cell.column
+
+        # 헤더 행 찾기: 정책 이름 컬럼, 작업구분 컬럼, 제외사유 컬럼 찾기
+        # 지원하는 컬럼 이름: "Rule Name", "Rulename", "Policy Name"
+        # 작업구분 컬럼: "작업구분", "Task Type", "TaskType", "Task"
+        # 제외사유 컬럼: "제외사유", "Exclusion Reason", "ExclusionReason", "Reason"
+        header_row_idx = None
+        rulename_col_idx = None
+        task_type_col_idx = None
+        exclusion_reason_col_idx = None
+
+        # 성능 최적화: 헤더 탐색 범위 전체를 COM 호출 한 번으로 읽은 뒤 메모리에서 스캔
+        search_rows = min(50, max_row)
+        search_cols = min(max_col, 200)
+        header_block = _as_2d_block(ws.range((1, 1), (search_rows, search_cols)).value, search_rows)
+
+        for row_idx, row in enumerate(header_block, 1):
+            for col_idx, cell_value in enumerate(row, 1):
+                # 헤더는 문자열이므로 숫자/None 셀은 조회 없이 건너뛰기 (한글/영문 헤더 모두 지원)
+                if isinstance(cell_value, str) and cell_value:
+                    role = _TARGET_HDR.get(cell_value.strip().lower())
+                    if role == 'rulename':
+                        if rulename_col_idx is None:
+                            rulename_col_idx = col_idx
+                    elif role == 'task':
+                        if task_type_col_idx is None:
+                            task_type_col_idx = col_idx
+                    elif role == 'exclusion':
+                        if exclusion_reason_col_idx is None:
+                            exclusion_reason_col_idx = col_idx
+
+                # 세 컬럼을 모두 찾았으면 남은 셀은 읽지 않음 (불필요한 COM 호출 방지)
+                if (rulename_col_idx is not None
+                        and task_type_col_idx is not None
+                        and exclusion_reason_col_idx is not None):
+                    break
+
+            # 정책 이름 컬럼을 찾으면 헤더 행으로 설정
+            if rulename_col_idx is not None:
+                header_row_idx = row_idx
+                break
+
+        if header_row_idx is None or rulename_col_idx is None:
+            raise ValueError(f"'{file_path}'에서 정책 이름 컬럼('Rule Name', 'Rulename', 또는 'Policy Name')을 찾을 수 없습니다.")
+
+        # 헤더 행 이후부터 마지막 행까지 데이터 읽기
+        data_start_row = header_row_idx + 1
+        data_end_row = max_row
+
+        if data_start_row > data_end_row:
+            return [], None, None
+
+        # 정책 이름 컬럼 읽기
+        rulename_range = ws.range((data_start_row, rulename_col_idx), (data_end_row, rulename_col_idx))
+        rulename_values = rulename_range.value
+
+        # 작업구분 컬럼이 있으면 읽기
+        task_type_values = None
+        if task_type_col_idx is not None:
+            task_type_range = ws.range((data_start_row, task_type_col_idx), (data_end_row, task_type_col_idx))
+            task_type_values = task_type_range.value
+
+        # 제외사유 컬럼이 있으면 읽기
+        exclusion_reason_values = None
+        if exclusion_reason_col_idx is not None:
+            exclusion_reason_range = ws.range((data_start_row, exclusion_reason_col_idx), (data_end_row, exclusion_reason_col_idx))
+            exclusion_reason_values = exclusion_reason_range.value
+
+    return rulename_values, task_type_values, exclusion_reason_values
+
+
 def parse_target_file(file_path: str) -> List[str]:
     """
     대상 정책 파일을 파싱하여 정책 이름 목록을 추출합니다.
-    
+
     - "Rule Name", "Rulename", "Policy Name" 컬럼 모두 지원
     - "작업구분" (Task Type) 컬럼이 있으면 값이 "삭제" (Delete)인 행만 추출 (없으면 모든 행 추출)
     - "제외사유" 컬럼이 있으면 빈 데이터인 행만 추출
     - Enable 컬럼은 없음
-    
+
     Args:
         file_path (str): 대상 정책 파일 경로 (Excel 파일)
-    
+
     Returns:
         List[str]: 정책 이름 리스트
     """
     try:
-        # xlwings로 Excel 파일 열기
-        with xw.App(visible=False) as app:
-            wb = app.books.open(file_path)
-            ws = wb.sheets[0]
-            
-            # 사용된 범위 가져오기
-            if not ws.used_range:
-                wb.close()
-                return []
-            
-            # 실제 사용된 마지막 행과 열 가져오기
-            max_row = ws.used_range.last_cell.row
-            max_col = ws.used_range.last_cell.column
-            
-            # 헤더 행 찾기: 정책 이름 컬럼, 작업구분 컬럼, 제외사유 컬럼 찾기
-            # 지원하는 컬럼 이름: "Rule Name", "Rulename", "Policy Name"
-            # 작업구분 컬럼: "작업구분", "Task Type", "TaskType", "Task"
-            # 제외사유 컬럼: "제외사유", "Exclusion Reason", "ExclusionReason", "Reason"
-            header_row_idx = None
-            rulename_col_idx = None
-            task_type_col_idx = None
-            exclusion_reason_col_idx = None
-            
-            search_rows = min(50, max_row)
-            for row_idx in range(1, search_rows + 1):
-                for col_idx in range(1, min(max_col + 1, 200)):
-                    cell_value = ws.range((row_idx, col_idx)).value
-                    if cell_value:
-                        cell_str = str(cell_value).strip().lower()
-                        # 정책 이름 컬럼 찾기
-                        if rulename_col_idx is None and cell_str in ['rule name', 'rulename', 'policy name']:
-                            rulename_col_idx = col_idx
-                        # 작업구분 컬럼 찾기 (한글/영문 모두 지원)
-                        if task_type_col_idx is None and cell_str in ['작업구분', 'task type', 'tasktype', 'task']:
-                            task_type_col_idx = col_idx
-                        # 제외사유 컬럼 찾기 (한글/영문 모두 지원)
-                        if exclusion_reason_col_idx is None and cell_str in ['제외사유', 'exclusion reason', 'exclusionreason', 'reason', 'exclusion']:
-                            exclusion_reason_col_idx = col_idx
-                
-                # 정책 이름 컬럼을 찾으면 헤더 행으로 설정
-                if rulename_col_idx is not None:
-                    header_row_idx = row_idx
-                    break
-            
-            if header_row_idx is None or rulename_col_idx is None:
-                wb.close()
-                raise ValueError(f"'{file_path}'에서 정책 이름 컬럼('Rule Name', 'Rulename', 또는 'Policy Name')을 찾을 수 없습니다.")
-            
-            # 헤더 행 이후부터 마지막 행까지 데이터 읽기
-            data_start_row = header_row_idx + 1
-            data_end_row = max_row
-            
-            if data_start_row > data_end_row:
-                wb.close()
-                return []
-            
-            # 정책 이름 컬럼 읽기
-            rulename_range = ws.range((data_start_row, rulename_col_idx), (data_end_row, rulename_col_idx))
-            rulename_values = rulename_range.value
-            
-            # 작업구분 컬럼이 있으면 읽기
-            task_type_values = None
-            if task_type_col_idx is not None:
-                task_type_range = ws.range((data_start_row, task_type_col_idx), (data_end_row, task_type_col_idx))
-                task_type_values = task_type_range.value
-            
-            # 제외사유 컬럼이 있으면 읽기
-            exclusion_reason_values = None
-            if exclusion_reason_col_idx is not None:
-                exclusion_reason_range = ws.range((data_start_row, exclusion_reason_col_idx), (data_end_row, exclusion_reason_col_idx))
-                exclusion_reason_values = exclusion_reason_range.value
-            
-            wb.close()
-        
-        # 리스트로 변환 (xlwings 반환값 처리)
-        def normalize_values(values):
-            if values is None:
-                return []
-            elif not isinstance(values, list):
-                return [values]
-            elif len(values) > 0 and isinstance(values[0], list):
-                return [row[0] if row else None for row in values]
+        # 성능 최적화: 확장자별 네이티브 파서로 직접 읽기 (.xlsx → openpyxl,
+        # .xls → xlrd, Excel 실행 없이 동작)
+        # DRM 보호 파일 등 네이티브 파서가 열지 못하는 경우에만 xlwings로 폴백
+        ext = os.path.splitext(file_path)[1].lower()
+        try:
+            native_readable = True
+            if ext == '.xls':
+                columns = _read_target_columns_xlrd(file_path)
             else:
-                return values
-        
-        rulename_values = normalize_values(rulename_values)
-        task_type_values = normalize_values(task_type_values) if task_type_values is not None else None
-        exclusion_reason_values = normalize_values(exclusion_reason_values) if exclusion_reason_values is not None else None
-        
-        # 정책 이름 추출
-        policies = []
-        for idx, rulename in enumerate(rulename_values):
-            # 작업구분 컬럼이 있고 값이 "삭제" (Delete)가 아니면 건너뛰기
-            # 작업구분 컬럼이 없으면 모든 행을 추출
-            if task_type_values is not None and idx < len(task_type_values):
-                task_type = str(task_type_values[idx]).strip() if task_type_values[idx] is not None else ''
-                task_type_lower = task_type.lower()
-                # "삭제" 또는 "delete" 모두 지원
-                if task_type_lower not in ['삭제', 'delete']:
-                    continue
-            
-            # 제외사유 컬럼이 있으면 빈 데이터인 행만 추출
-            if exclusion_reason_values is not None and idx < len(exclusion_reason_values):
-                exclusion_reason = exclusion_reason_values[idx]
-                # None이 아니고 빈 문자열이 아니면 건너뛰기
-                if exclusion_reason is not None:
-                    exclusion_reason_str = str(exclusion_reason).strip()
-                    if exclusion_reason_str:  # 빈 문자열이 아니면 제외
-                        continue
-            
-            # 정책 이름이 있으면 추가
-            if rulename is not None:
-                rulename_str = str(rulename).strip()
-                if rulename_str:
-                    policies.append(rulename_str)
-        
-        # 중복 제거
-        policies = list(dict.fromkeys(policies))  # 순서 유지하면서 중복 제거
+                # calamine(Rust)이 설치돼 있으면 최우선 사용, 아니면 openpyxl
+                try:
+                    columns = _read_target_columns_calamine(file_path)
+                except ValueError:
+                    raise
+                except Exception:
+                    columns = _read_target_columns_openpyxl(file_path)
+        except ValueError:
+            raise
+        except Exception:
+            native_readable = False
+
+        if not native_readable:
+            columns = _read_target_columns_xlwings(file_path)
+
+        rulename_values, task_type_values, exclusion_reason_values = columns
+
+        # 1차원 배열로 통일 (xlwings 반환값 처리, numpy C 레벨 reshape)
+        rulename_values = _normalize_column(rulename_values)
+        task_type_values = _normalize_column(task_type_values) if task_type_values is not None else None
+        exclusion_reason_values = _normalize_column(exclusion_reason_values) if exclusion_reason_values is not None else None
         
+        # 정책 이름 추출 (벡터화: 행 단위 파이썬 루프 대신 불리언 마스크)
+        # 문자열 변환/공백 제거를 pandas C 커널로 일괄 처리 (행 단위 파이썬 호출 없음)
+        rules = pd.Series(rulename_values, dtype=object).fillna('').astype(str).str.strip()
+        mask = (rules != '').to_numpy(dtype=bool, na_value=False, copy=True)
+
+        # 작업구분 컬럼이 있고 값이 "삭제" (Delete)가 아니면 건너뛰기
+        # 작업구분 컬럼이 없으면 모든 행을 추출 ("삭제"/"delete" 모두 지원)
+        if task_type_values is not None:
+            task = pd.Series(task_type_values, dtype=object).fillna('').astype(str).str.strip().str.lower()
+            n = min(len(task), len(rules))
+            mask[:n] &= task.iloc[:n].isin(_DELETE_VALUES).to_numpy()
+
+        # 제외사유 컬럼이 있으면 빈 데이터인 행만 추출
+        if exclusion_reason_values is not None:
+            exclusion = pd.Series(exclusion_reason_values, dtype=object).fillna('').astype(str).str.strip()
+            n = min(len(exclusion), len(rules))
+            mask[:n] &= (exclusion.iloc[:n] == '').to_numpy()
+
+        # 중복 제거 (순서 유지, C 레벨 해시테이블 사용)
+        policies = pd.unique(rules.to_numpy()[mask]).tolist()
+
         return policies
     
     except Exception as e:
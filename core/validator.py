@@ -4,6 +4,7 @@
 Running 정책과 Candidate 정책을 비교하여 변경 사항을 검증합니다.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List
 
@@ -38,13 +39,49 @@ def normalize_enable(value: str) -> str:
         str: 정규화된 값 ('Y' 또는 'N')
     """
     value_str = str(value).strip().upper()
-    if value_str in ['Y', 'YES', 'TRUE', '1', 'ENABLED', 'ENABLE']:
+    if value_str in _ENABLE_Y:
         return 'Y'
-    elif value_str in ['N', 'NO', 'FALSE', '0', 'DISABLED', 'DISABLE']:
+    elif value_str in _ENABLE_N:
         return 'N'
     return value_str
 
 
+# 활성/비활성으로 인식하는 값 (모듈 로드 시 한 번만 생성, O(1) 해시 조회)
+_ENABLE_Y = frozenset({'Y', 'YES', 'TRUE', '1', 'ENABLED', 'ENABLE'})
+_ENABLE_N = frozenset({'N', 'NO', 'FALSE', '0', 'DISABLED', 'DISABLE'})
+
+# normalize_enable과 동일한 매핑의 벡터화용 테이블 (값 -> 'Y'/'N')
+_ENABLE_MAP = {
+    **{k: 'Y' for k in _ENABLE_Y},
+    **{k: 'N' for k in _ENABLE_N},
+}
+
+
+def _normalize_enable_series(s: pd.Series) -> pd.Series:
+    """
+    normalize_enable을 Series 전체에 C 레벨 연산으로 한 번에 적용합니다.
+    (행마다 파이썬 함수를 호출하지 않음. 매핑에 없는 값은 대문자 그대로 유지)
+    """
+    upper = s.astype(str).str.strip().str.upper()
+    # astype(str)는 결측값을 결측으로 유지하므로 스칼라 str() 동작에 맞춰 보정
+    return upper.map(_ENABLE_MAP).fillna(upper).fillna('NONE')
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정책 DataFrame을 비교용으로 정규화합니다.
+
+    Returns:
+        pd.DataFrame: 'Policy'(정규화된 정책명), 'Enable'(정규화된 Y/N) 컬럼.
+                      빈 정책명 제거, 중복 정책명은 마지막 행만 유지.
+    """
+    names = df['Rulename'].map(normalize_policy_name)
+    enables = _normalize_enable_series(df['Enable'])
+    norm = pd.DataFrame({'Policy': names, 'Enable': enables})
+    norm = norm[norm['Policy'] != '']
+    return norm.drop_duplicates(subset='Policy', keep='last')
+
+
 def validate_policy_changes(
     running_df: pd.DataFrame,
     candidate_df: pd.DataFrame,
@@ -68,104 +105,98 @@ def validate_policy_changes(
         pd.DataFrame: 검증 결과 리포트
                      컬럼: ['Policy', 'Status', 'Running_Enable', 'Candidate_Enable', 'Message', 'IsTarget']
     """
-    # 성능 최적화: 딕셔너리로 변환하여 O(1) 조회. 정책명은 normalize로 통일 (12.0 vs "12" 비교 가능)
-    running_dict = {}
-    for _, row in running_df.iterrows():
-        policy_name = normalize_policy_name(row['Rulename'])
-        if policy_name:
-            running_dict[policy_name] = normalize_enable(row['Enable'])
-    
-    candidate_dict = {}
-    for _, row in candidate_df.iterrows():
-        policy_name = normalize_policy_name(row['Rulename'])
-        if policy_name:
-            candidate_dict[policy_name] = normalize_enable(row['Enable'])
-    
-    results = []
-    target_set = set(normalize_policy_name(p) for p in target_policies if normalize_policy_name(p))
-    
-    # 1. 대상 정책 검증
-    for policy_name in target_policies:
-        policy_name = normalize_policy_name(policy_name)
-        if not policy_name:
-            continue
-        
-        running_enable = running_dict.get(policy_name)
-        candidate_enable = candidate_dict.get(policy_name)
-        
-        status = ""
-        message = ""
-        
-        if running_enable is None:
-            # Running에 없는 경우
-            status = "NOT_IN_RUNNING"
-            message = "Running 정책에 존재하지 않음"
-            running_enable = None
-        elif candidate_enable is None:
-            # Running에는 있지만 Candidate에는 없는 경우 (삭제됨)
-            status = "DELETED"
-            message = "정책이 삭제되었습니다. ✓"
-        else:
-            # 둘 다 있는 경우 - Enable 상태 확인
-            if running_enable == 'Y' and candidate_enable == 'N':
-                status = "DISABLED"
-                message = "정책이 비활성화되었습니다. ✓"
-            elif running_enable == 'N' and candidate_enable == 'Y':
-                status = "RE_ENABLED"
-                message = "정책이 다시 활성화되었습니다. ⚠"
-            elif running_enable == candidate_enable:
-                if running_enable == 'Y':
-                    status = "NOT_DISABLED"
-                    message = "비활성화되지 않았습니다. ⚠"
-                else:
-                    status = "NO_CHANGE"
-                    message = f"변경 없음 (상태: {running_enable})"
-            else:
-                status = "CHANGED"
-                message = f"Enable 상태 변경: {running_enable} -> {candidate_enable}"
-        
-        results.append({
-            'Policy': policy_name,
-            'Status': status,
-            'Running_Enable': running_enable if running_enable else 'N/A',
-            'Candidate_Enable': candidate_enable if candidate_enable else 'N/A',
-            'Message': message,
-            'IsTarget': True
-        })
-    
-    # 2. 대상 외에 삭제되거나 비활성화된 정책 찾기
-    running_policies_set = set(running_dict.keys())
-    candidate_policies_set = set(candidate_dict.keys())
-    
-    # Running에 있지만 Candidate에 없는 정책 (삭제된 정책)
-    deleted_policies = running_policies_set - candidate_policies_set - target_set
-    
-    for policy_name in deleted_policies:
-        running_enable = running_dict[policy_name]
-        results.append({
-            'Policy': policy_name,
-            'Status': 'UNEXPECTED_DELETED',
-            'Running_Enable': running_enable,
-            'Candidate_Enable': 'N/A',
-            'Message': '대상 외 정책이 삭제되었습니다. ⚠',
-            'IsTarget': False
-        })
-    
-    # 3. 대상 외에 비활성화된 정책 찾기 (Y → N)
-    common_policies = running_policies_set & candidate_policies_set - target_set
-    
-    for policy_name in common_policies:
-        running_enable = running_dict[policy_name]
-        candidate_enable = candidate_dict[policy_name]
-        
-        if running_enable == 'Y' and candidate_enable == 'N':
-            results.append({
-                'Policy': policy_name,
-                'Status': 'UNEXPECTED_DISABLED',
-                'Running_Enable': running_enable,
-                'Candidate_Enable': candidate_enable,
-                'Message': '대상 외 정책이 비활성화되었습니다. ⚠',
-                'IsTarget': False
-            })
-    
-    return pd.DataFrame(results)
+    # 성능 최적화: iterrows 대신 컬럼 단위로 한 번에 정규화 (행 단위 파이썬 루프 제거)
+    # 정책명은 normalize로 통일 (12.0 vs "12" 비교 가능)
+    running_norm = _normalize_frame(running_df)
+    candidate_norm = _normalize_frame(candidate_df)
+
+    # O(1) 조회용 딕셔너리 (중복 정책명은 마지막 행이 우선 - 기존 동작과 동일)
+    running_dict = dict(zip(running_norm['Policy'], running_norm['Enable']))
+    candidate_dict = dict(zip(candidate_norm['Policy'], candidate_norm['Enable']))
+
+    # 대상 정책명 정규화 (빈 이름 제외, 입력 순서·중복은 기존 동작대로 유지)
+    names_all = pd.Series([normalize_policy_name(p) for p in target_policies], dtype=object)
+    names = names_all[names_all != ''].reset_index(drop=True)
+    # 대상 정책명 Index (libpandas 해시테이블 기반 isin 연산용)
+    target_idx = pd.Index(names).unique()
+
+    # 1. 대상 정책 검증 (벡터화: 이름별 dict.get 분기 루프 대신 map + np.select)
+    # astype(object): 매칭이 전혀 없으면 map이 float64(NaN) Series를 반환해
+    # 아래 문자열 연결이 실패하므로 dtype을 object로 고정
+    run_en = names.map(running_dict).astype(object)
+    cand_en = names.map(candidate_dict).astype(object)
+    in_running = run_en.notna().to_numpy()
+    in_candidate = cand_en.notna().to_numpy()
+    run_arr = run_en.fillna('').to_numpy(dtype=object)
+    cand_arr = cand_en.fillna('').to_numpy(dtype=object)
+
+    # 분기 우선순위는 기존 if/elif 체인과 동일
+    conditions = [
+        ~in_running,
+        ~in_candidate,
+        (run_arr == 'Y') & (cand_arr == 'N'),
+        (run_arr == 'N') & (cand_arr == 'Y'),
+        (run_arr == cand_arr) & (run_arr == 'Y'),
+        run_arr == cand_arr,
+    ]
+    status = np.select(conditions, [
+        'NOT_IN_RUNNING', 'DELETED', 'DISABLED', 'RE_ENABLED', 'NOT_DISABLED', 'NO_CHANGE'
+    ], default='CHANGED')
+    messages = np.select(conditions, [
+        'Running 정책에 존재하지 않음',
+        '정책이 삭제되었습니다. ✓',
+        '정책이 비활성화되었습니다. ✓',
+        '정책이 다시 활성화되었습니다. ⚠',
+        '비활성화되지 않았습니다. ⚠',
+        ('변경 없음 (상태: ' + run_en.fillna('') + ')').to_numpy(dtype=object),
+    ], default=('Enable 상태 변경: ' + run_en.fillna('') + ' -> ' + cand_en.fillna('')).to_numpy(dtype=object))
+
+    target_results = pd.DataFrame({
+        'Policy': names.to_numpy(dtype=object),
+        'Status': status,
+        'Running_Enable': np.where(run_arr == '', 'N/A', run_arr),
+        'Candidate_Enable': np.where(cand_arr == '', 'N/A', cand_arr),
+        'Message': messages,
+        'IsTarget': True
+    })
+
+    # 2~3. 대상 외에 삭제되거나 비활성화된 정책 찾기 (벡터화: outer merge + np.select)
+    merged = running_norm.merge(
+        candidate_norm,
+        on='Policy',
+        how='outer',
+        suffixes=('_r', '_c'),
+        indicator=True
+    )
+    non_target = merged[~merged['Policy'].isin(target_idx)]
+
+    # Running에만 있으면 삭제, 둘 다 있는데 Y → N이면 비활성화
+    deleted_mask = (non_target['_merge'] == 'left_only').to_numpy()
+    disabled_mask = (
+        (non_target['_merge'] == 'both')
+        & (non_target['Enable_r'] == 'Y')
+        & (non_target['Enable_c'] == 'N')
+    ).to_numpy()
+    status = np.select(
+        [deleted_mask, disabled_mask],
+        ['UNEXPECTED_DELETED', 'UNEXPECTED_DISABLED'],
+        default=''
+    )
+
+    flagged = status != ''
+    unexpected_results = pd.DataFrame({
+        'Policy': non_target['Policy'].to_numpy()[flagged],
+        'Status': status[flagged],
+        'Running_Enable': non_target['Enable_r'].to_numpy()[flagged],
+        'Candidate_Enable': non_target['Enable_c'].fillna('N/A').to_numpy()[flagged],
+        'Message': np.where(
+            status[flagged] == 'UNEXPECTED_DELETED',
+            '대상 외 정책이 삭제되었습니다. ⚠',
+            '대상 외 정책이 비활성화되었습니다. ⚠'
+        ),
+        'IsTarget': False
+    })
+
+    report = pd.concat([target_results, unexpected_results], ignore_index=True)
+    # Status는 범주형으로 저장 (value_counts/필터가 코드 단위로 동작, 대용량 결과의 메모리 절감)
+    return report.astype({'Status': 'category', 'IsTarget': bool})
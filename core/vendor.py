@@ -4,11 +4,23 @@
 벤더별로 다른 정책 파일 포맷을 처리합니다.
 """
 
-import xlwings as xw
 import pandas as pd
 from typing import List, Optional, Tuple
 import re
 
+from .parser import _as_2d_block, _open_workbook, _read_policy_columns_openpyxl
+
+
+def _s(x) -> str:
+    """
+    셀 값을 공백 제거된 문자열로 변환합니다. (행 단위 핫 루프용)
+
+    이미 문자열인 셀(대부분의 경우)은 str() 객체 생성 없이 strip()만 수행합니다.
+    """
+    if x is None:
+        return ''
+    return x.strip() if isinstance(x, str) else str(x).strip()
+
 
 class PaloaltoParser:
     """Paloalto 정책 파일 파서"""
@@ -25,57 +37,77 @@ class PaloaltoParser:
             pd.DataFrame: 'Rulename'과 'Enable' 컬럼을 가진 DataFrame
         """
         try:
-            with xw.App(visible=False) as app:
-                wb = app.books.open(file_path)
-                ws = wb.sheets[0]
-                
-                if not ws.used_range:
-                    wb.close()
-                    return pd.DataFrame(columns=['Rulename', 'Enable'])
-                
-                max_row = ws.used_range.last_cell.row
-                max_col = ws.used_range.last_cell.column
-                
-                # 헤더 행 찾기
-                header_row_idx = None
-                rulename_col_idx = None
-                enable_col_idx = None
-                
-                search_rows = min(50, max_row)
-                for row_idx in range(1, search_rows + 1):
-                    for col_idx in range(1, min(max_col + 1, 200)):
-                        cell_value = ws.range((row_idx, col_idx)).value
-                        if cell_value:
-                            cell_str = str(cell_value).strip().lower()
-                            if cell_str == 'rulename' and rulename_col_idx is None:
-                                rulename_col_idx = col_idx
-                            elif cell_str == 'enable' and enable_col_idx is None:
-                                enable_col_idx = col_idx
-                    
-                    if rulename_col_idx is not None and enable_col_idx is not None:
-                        header_row_idx = row_idx
-                        break
-                
-                if header_row_idx is None or rulename_col_idx is None or enable_col_idx is None:
-                    wb.close()
-                    raise ValueError(f"'{file_path}'에서 'Rulename'과 'Enable' 컬럼을 찾을 수 없습니다.")
-                
-                # 데이터 읽기
-                data_start_row = header_row_idx + 1
-                data_end_row = max_row
-                
-                if data_start_row <= data_end_row:
-                    rulename_range = ws.range((data_start_row, rulename_col_idx), (data_end_row, rulename_col_idx))
-                    rulename_values = rulename_range.value
-                    
-                    enable_range = ws.range((data_start_row, enable_col_idx), (data_end_row, enable_col_idx))
-                    enable_values = enable_range.value
-                else:
-                    rulename_values = []
-                    enable_values = []
-                
-                wb.close()
-            
+            # openpyxl read_only 빠른 경로: Excel 프로세스/COM 없이 스트리밍 읽기
+            # (DRM 보호 파일 등 openpyxl이 열 수 없는 경우에만 xlwings 폴백)
+            openpyxl_readable = True
+            try:
+                rulename_values, enable_values = _read_policy_columns_openpyxl(file_path)
+            except ValueError:
+                raise
+            except Exception:
+                openpyxl_readable = False
+
+            if not openpyxl_readable:
+                # excel_session() 안이면 공유 Excel 프로세스를 재사용 (파일마다 기동/종료 제거)
+                with _open_workbook(file_path) as wb:
+                    ws = wb.sheets[0]
+
+                    if not ws.used_range:
+                        return pd.DataFrame(columns=['Rulename', 'Enable'])
+
+                    max_row = ws.used_range.last_cell.row
+                    max_col = ws.used_range.last_cell.column
+
+                    # 헤더 행 찾기
+                    header_row_idx = None
+                    rulename_col_idx = None
+                    enable_col_idx = None
+
+                    # 헤더 블록을 한 번에 읽어 메모리에서 스캔 (셀 단위 COM 호출 제거)
+                    search_rows = min(50, max_row)
+                    search_cols = min(max_col, 200)
+                    header_block = _as_2d_block(
+                        ws.range((1, 1), (search_rows, search_cols)).value, search_rows
+                    )
+                    for row_idx, row in enumerate(header_block, 1):
+                        for col_idx, cell_value in enumerate(row, 1):
+                            # 헤더는 문자열이므로 숫자/None 셀은 strip/lower 없이 건너뛰기
+                            if isinstance(cell_value, str) and cell_value:
+                                cell_str = cell_value.strip().lower()
+                                if cell_str == 'rulename' and rulename_col_idx is None:
+                                    rulename_col_idx = col_idx
+                                elif cell_str == 'enable' and enable_col_idx is None:
+                                    enable_col_idx = col_idx
+                                # 두 컬럼을 모두 찾으면 남은 열 스캔 생략
+                                if rulename_col_idx is not None and enable_col_idx is not None:
+                                    break
+
+                        if rulename_col_idx is not None and enable_col_idx is not None:
+                            header_row_idx = row_idx
+                            break
+
+                    if header_row_idx is None or rulename_col_idx is None or enable_col_idx is None:
+                        raise ValueError(f"'{file_path}'에서 'Rulename'과 'Enable' 컬럼을 찾을 수 없습니다.")
+
+                    # 데이터 읽기
+                    data_start_row = header_row_idx + 1
+                    data_end_row = max_row
+
+                    if data_start_row <= data_end_row:
+                        # 두 컬럼의 경계 사각형을 한 번에 읽고 메모리에서 분리 (COM 마샬링 1회)
+                        lo = min(rulename_col_idx, enable_col_idx)
+                        hi = max(rulename_col_idx, enable_col_idx)
+                        data_block = _as_2d_block(
+                            ws.range((data_start_row, lo), (data_end_row, hi)).value,
+                            data_end_row - data_start_row + 1
+                        )
+                        rulename_values = [row[rulename_col_idx - lo] for row in data_block]
+                        enable_values = [row[enable_col_idx - lo] for row in data_block]
+                    else:
+                        rulename_values = []
+                        enable_values = []
+
+
             # 값 정규화
             def normalize_values(values):
                 if values is None:
@@ -129,10 +161,8 @@ class SECUIParser:
             List[str]: 시트 이름 리스트
         """
         try:
-            with xw.App(visible=False) as app:
-                wb = app.books.open(file_path)
+            with _open_workbook(file_path) as wb:
                 sheet_names = [sheet.name for sheet in wb.sheets]
-                wb.close()
             return sheet_names
         except Exception as e:
             raise ValueError(f"시트 목록 가져오기 오류 ({file_path}): {e}")
@@ -188,12 +218,11 @@ class SECUIParser:
         diag = []  # 진행 단계 기록 (실패 시 메시지에 포함)
         try:
             diag.append("파일 열기")
-            with xw.App(visible=False) as app:
-                wb = app.books.open(file_path)
+            # excel_session() 안이면 공유 Excel 프로세스를 재사용 (파일마다 기동/종료 제거)
+            with _open_workbook(file_path) as wb:
                 diag.append("시트 목록 확인")
                 sheet_names = [s.name for s in wb.sheets]
                 if sheet_name not in sheet_names:
-                    wb.close()
                     raise ValueError(
                         f"[SECUI 파싱] 시트를 찾을 수 없습니다. "
                         f"요청 시트: {sheet_name!r}, 존재 시트: {sheet_names}. "
@@ -202,7 +231,6 @@ class SECUIParser:
                 ws = wb.sheets[sheet_name]
                 diag.append("used_range 확인")
                 if not ws.used_range:
-                    wb.close()
                     return pd.DataFrame(columns=['Rulename', 'Enable'])
                 max_row = ws.used_range.last_cell.row
                 max_col = min(ws.used_range.last_cell.column, 200)
@@ -226,9 +254,9 @@ class SECUIParser:
                     for c, cell in enumerate(row, 1):
                         if c > max_c:
                             break
-                        if cell is None:
+                        if not isinstance(cell, str):
                             continue
-                        s = str(cell).strip().lower()
+                        s = cell.strip().lower()
                         if id_col_idx is None and s == 'id':
                             id_col_idx = c
                         if enable_col_idx is None and s == 'enable':
@@ -252,7 +280,6 @@ class SECUIParser:
                     row_sample = SECUIParser._diag_row_sample(
                         header_block[0] if header_block else None
                     )
-                    wb.close()
                     raise ValueError(
                         f"[SECUI 파싱] 헤더(2~10행)에서 'Enable' 컬럼을 찾을 수 없습니다. "
                         f"첫 행 셀 샘플: {row_sample}. "
@@ -262,7 +289,6 @@ class SECUIParser:
                     row_sample = SECUIParser._diag_row_sample(
                         header_block[0] if header_block else None
                     )
-                    wb.close()
                     raise ValueError(
                         f"[SECUI 파싱] 헤더(2~10행)와 데이터 샘플에서 'ID' 컬럼을 찾을 수 없습니다. "
                         f"첫 행 셀 샘플: {row_sample}. "
@@ -273,12 +299,10 @@ class SECUIParser:
 
                 data_start_row = 9
                 if data_start_row > max_row:
-                    wb.close()
                     return pd.DataFrame(columns=['Rulename', 'Enable'])
 
                 diag.append("데이터 블록 읽기 (9행~)")
                 data_block = ws.range((data_start_row, 1), (max_row, max_col)).value
-                wb.close()
 
             # 블록이 단일 행이면 2차원으로
             diag.append("데이터 블록 정규화")
@@ -317,7 +341,7 @@ class SECUIParser:
                 id_str = SECUIParser._normalize_id(id_val)
                 if id_str is not None:
                     id_values.append(id_str)
-                    enable_values.append((en_val if en_val is not None else '').__str__().strip())
+                    enable_values.append(_s(en_val))
 
             diag.append("DataFrame 생성")
             df = pd.DataFrame({'Rulename': id_values, 'Enable': enable_values})
@@ -21,12 +21,19 @@ from werkzeug.utils import secure_filename
 from datetime import datetime
 import pandas as pd
 from core import parse_policy_file, parse_target_file, validate_policy_changes
-from core.utils import get_summary_dict
+from core.utils import get_summary_dict, save_report
 from core.vendor import PaloaltoParser, SECUIParser
 from rich.console import Console
+import hashlib
+import json
 import tempfile
 import shutil
+import threading
+import time
 import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
 
 # exe 빌드 시 템플릿/static은 _MEIPASS 아래에 있음
 _template = os.path.join(_base, 'templates') if getattr(sys, 'frozen', False) else 'templates'
@@ -38,6 +45,9 @@ app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp()
 
 console = Console()
 
+# 상세 트레이스백은 디버그 플래그를 켠 경우에만 출력 (반복 실패 시 로그 오염/비용 방지)
+_DEBUG = os.environ.get('VALIDATE_POLICY_DEBUG') == '1'
+
 # 허용된 파일 확장자
 ALLOWED_EXTENSIONS = {'xlsx', 'xls'}
 
@@ -47,6 +57,97 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def _save_upload(file_storage, dest_path):
+    """
+    업로드 스트림을 1MB 버퍼로 디스크에 복사하고 내용 해시를 반환합니다.
+
+    werkzeug의 file.save 기본 8KB 청크는 100MB 업로드에 1만 회 이상의
+    읽기/쓰기를 유발하므로 큰 버퍼로 syscall 수를 줄입니다. 해시는 저장과
+    같은 패스에서 계산되어 파싱 결과 캐시의 키로 사용됩니다.
+
+    Returns:
+        str: 파일 내용의 blake2b 해시 (hex)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(str(dest_path), 'wb') as out:
+        while True:
+            chunk = file_storage.stream.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
+
+
+def _cached_parse(file_hash, cache_tag, parse_fn, *args):
+    """
+    내용 해시 기준으로 파싱 결과를 pickle 캐시합니다.
+
+    같은 정책 파일을 다시 업로드하면 (대상 목록만 바꿔 재검증하는 경우가
+    흔함) openpyxl/pandas 파싱을 건너뜁니다. 캐시는 UPLOAD_FOLDER/_cache에
+    저장되어 백그라운드 정리 대상에 포함됩니다. 캐시 실패는 무시하고 그냥
+    파싱합니다.
+    """
+    key = hashlib.blake2b(f"{file_hash}:{cache_tag}".encode(), digest_size=16).hexdigest()
+    cache_path = Path(app.config['UPLOAD_FOLDER']) / '_cache' / f"{key}.pkl"
+    if cache_path.exists():
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            pass
+    result = parse_fn(*args)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        result.to_pickle(cache_path)
+    except Exception:
+        pass
+    return result
+
+
+def _read_sheet_names(path):
+    """
+    xlsx의 xl/workbook.xml만 ZIP에서 직접 읽어 시트 이름을 가져옵니다.
+
+    스타일/공유 문자열/시트 본문을 전혀 파싱하지 않으므로 파일 크기와
+    무관하게 즉시 반환됩니다. (xlsx가 아니거나 읽기 실패 시 예외 발생)
+    """
+    with zipfile.ZipFile(path) as zf:
+        root = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+    ns = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+    return [s.get('name') for s in root.iter(f'{ns}sheet')]
+
+
+# 오래된 업로드 디렉터리 정리 주기/기준 (장시간 실행 시 디스크 누적 방지)
+_PURGE_INTERVAL_SECONDS = 600
+_PURGE_MAX_AGE_SECONDS = 3600
+
+
+def _purge_stale_uploads():
+    """마지막 사용 후 1시간이 지난 세션 업로드 디렉터리를 삭제하고 다음 실행을 예약합니다."""
+    try:
+        now = time.time()
+        with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+            for entry in entries:
+                try:
+                    if (entry.is_dir(follow_symlinks=False)
+                            and now - entry.stat().st_mtime > _PURGE_MAX_AGE_SECONDS):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                except OSError:
+                    continue
+    except Exception:
+        pass
+    finally:
+        timer = threading.Timer(_PURGE_INTERVAL_SECONDS, _purge_stale_uploads)
+        timer.daemon = True
+        timer.start()
+
+
+# 프로세스 수명 동안 10분마다 정리 (atexit 정리는 종료 시까지 파일을 쌓아둠)
+_purge_timer = threading.Timer(_PURGE_INTERVAL_SECONDS, _purge_stale_uploads)
+_purge_timer.daemon = True
+_purge_timer.start()
+
+
 def get_upload_dir():
     """세션별 업로드 디렉터리 경로 반환 (SecureCookieSession에는 sid가 없으므로 _upload_id 사용)"""
     if '_upload_id' not in session:
@@ -75,16 +176,19 @@ def get_sheets():
         upload_dir = get_upload_dir()
         upload_dir.mkdir(parents=True, exist_ok=True)
         temp_path = upload_dir / f"temp_{secure_filename(file.filename)}"
-        file.save(str(temp_path))
+        _save_upload(file, temp_path)
         
-        # 시트 목록 가져오기 (openpyxl 사용 - Excel 설치 없이 동작)
+        # 시트 목록 가져오기: ZIP에서 workbook.xml만 읽는 경로 → openpyxl → xlwings 순 폴백
         try:
-            import openpyxl
-            wb = openpyxl.load_workbook(str(temp_path), read_only=True)
-            sheets = wb.sheetnames
-            wb.close()
+            sheets = _read_sheet_names(str(temp_path))
         except Exception:
-            sheets = SECUIParser.get_sheets(str(temp_path))
+            try:
+                import openpyxl
+                wb = openpyxl.load_workbook(str(temp_path), read_only=True)
+                sheets = wb.sheetnames
+                wb.close()
+            except Exception:
+                sheets = SECUIParser.get_sheets(str(temp_path))
         
         # 임시 파일 삭제
         temp_path.unlink()
@@ -106,7 +210,11 @@ def upload_files():
         
         # 벤더 정보 가져오기
         vendor = request.form.get('vendor', 'Paloalto')
-        
+
+        # 업로드 디렉터리는 요청당 한 번만 계산/생성
+        upload_dir = get_upload_dir()
+        upload_dir.mkdir(parents=True, exist_ok=True)
+
         # 파일 확인
         if vendor == 'SECUI':
             if 'running_file' not in request.files:
@@ -124,18 +232,17 @@ def upload_files():
             if not allowed_file(running_file.filename):
                 return jsonify({'error': 'Excel 파일만 업로드 가능합니다 (.xlsx, .xls)'}), 400
 
-            upload_dir = get_upload_dir()
-            upload_dir.mkdir(parents=True, exist_ok=True)
             running_path = upload_dir / secure_filename(running_file.filename)
-            running_file.save(str(running_path))
+            running_hash = _save_upload(running_file, running_path)
 
             if use_same_file:
                 candidate_path = running_path
+                candidate_hash = running_hash
             else:
                 if not allowed_file(candidate_file.filename):
                     return jsonify({'error': 'Candidate 파일은 Excel(.xlsx, .xls)만 가능합니다.'}), 400
                 candidate_path = upload_dir / secure_filename(candidate_file.filename)
-                candidate_file.save(str(candidate_path))
+                candidate_hash = _save_upload(candidate_file, candidate_path)
         else:
             # Paloalto는 두 파일 필요
             if 'running_file' not in request.files or 'candidate_file' not in request.files:
@@ -151,54 +258,78 @@ def upload_files():
                 return jsonify({'error': 'Excel 파일만 업로드 가능합니다 (.xlsx, .xls)'}), 400
             
             # 파일 저장
-            upload_dir = get_upload_dir()
-            upload_dir.mkdir(parents=True, exist_ok=True)
-            
             running_path = upload_dir / secure_filename(running_file.filename)
             candidate_path = upload_dir / secure_filename(candidate_file.filename)
             
-            running_file.save(str(running_path))
-            candidate_file.save(str(candidate_path))
+            running_hash = _save_upload(running_file, running_path)
+            candidate_hash = _save_upload(candidate_file, candidate_path)
         
         # 대상 파일 저장 (여러 파일 선택 시 같은 파일명이면 덮어쓰기 방지를 위해 인덱스 부여)
+        # 대상 파일이 수백 개일 수 있으므로 루프 안에서는 Path 객체 대신
+        # 문자열 os.path.join 사용 (PurePath 생성/파싱 반복 제거)
         target_files = request.files.getlist('target_files')
+        upload_dir_str = str(upload_dir)
         target_paths = []
         for i, target_file in enumerate(target_files):
             if target_file.filename and allowed_file(target_file.filename):
                 base = secure_filename(target_file.filename)
-                name, ext = os.path.splitext(base)
-                target_path = upload_dir / f"target_{i}_{name}{ext}"
-                target_file.save(str(target_path))
+                target_path = os.path.join(upload_dir_str, f"target_{i}_{base}")
+                _save_upload(target_file, target_path)
                 target_paths.append(target_path)
         
-        # 정책 파일 파싱
-        console.print(f"[cyan]Running 정책 파싱 중... (벤더: {vendor})[/cyan]")
-        if vendor == 'SECUI':
-            running_policy_data = SECUIParser.parse_policy_file(str(running_path), running_sheet)
-        else:
-            running_policy_data = PaloaltoParser.parse_policy_file(str(running_path))
-        console.print(f"[green]✓ {len(running_policy_data)}개 정책 발견[/green]")
-        
-        console.print(f"[cyan]Candidate 정책 파싱 중... (벤더: {vendor})[/cyan]")
-        if vendor == 'SECUI':
-            candidate_policy_data = SECUIParser.parse_policy_file(str(candidate_path), candidate_sheet)
-        else:
-            candidate_policy_data = PaloaltoParser.parse_policy_file(str(candidate_path))
-        console.print(f"[green]✓ {len(candidate_policy_data)}개 정책 발견[/green]")
-        
-        # 대상 정책 목록 로드
+        # 정책/대상 파일 파싱 (I/O 병목 구간이므로 스레드로 병렬화)
+        console.print(f"[cyan]정책 파일 파싱 중... (벤더: {vendor})[/cyan]")
+        with ThreadPoolExecutor(max_workers=min(8, 2 + len(target_paths))) as executor:
+            if vendor == 'SECUI':
+                fut_running = executor.submit(
+                    _cached_parse, running_hash, f'secui:{running_sheet}',
+                    SECUIParser.parse_policy_file, str(running_path), running_sheet)
+                # 같은 내용의 같은 시트를 선택한 경우 한 번만 파싱
+                if candidate_hash == running_hash and candidate_sheet == running_sheet:
+                    fut_candidate = None
+                else:
+                    fut_candidate = executor.submit(
+                        _cached_parse, candidate_hash, f'secui:{candidate_sheet}',
+                        SECUIParser.parse_policy_file, str(candidate_path), candidate_sheet)
+            else:
+                fut_running = executor.submit(
+                    _cached_parse, running_hash, 'paloalto',
+                    PaloaltoParser.parse_policy_file, str(running_path))
+                # 내용이 동일한 파일을 두 번 올린 경우 한 번만 파싱
+                if candidate_hash == running_hash:
+                    fut_candidate = None
+                else:
+                    fut_candidate = executor.submit(
+                        _cached_parse, candidate_hash, 'paloalto',
+                        PaloaltoParser.parse_policy_file, str(candidate_path))
+            target_futures = [
+                executor.submit(parse_target_file, str(p)) for p in target_paths
+            ]
+            running_policy_data = fut_running.result()
+            if fut_candidate is None:
+                candidate_policy_data = running_policy_data.copy()
+            else:
+                candidate_policy_data = fut_candidate.result()
+        console.print(f"[green]✓ Running: {len(running_policy_data)}개 정책 발견[/green]")
+        console.print(f"[green]✓ Candidate: {len(candidate_policy_data)}개 정책 발견[/green]")
+
+        # 대상 정책 목록 로드 (파일 순서대로, 삽입 시점에 중복을 걸러 한 번만 적재)
         target_policies = []
         if target_paths:
-            for target_path in target_paths:
-                console.print(f"[cyan]대상 정책 파일 파싱 중: {target_path.name}[/cyan]")
+            seen = set()
+            for target_path, future in zip(target_paths, target_futures):
+                target_name = os.path.basename(target_path)
                 try:
-                    policies = parse_target_file(str(target_path))
-                    target_policies.extend(policies)
-                    console.print(f"[green]✓ {len(policies)}개 정책 발견[/green]")
+                    policies = future.result()
+                    count = 0
+                    for policy in policies:
+                        if policy not in seen:
+                            seen.add(policy)
+                            target_policies.append(policy)
+                            count += 1
+                    console.print(f"[green]✓ {target_name}: {count}개 정책 발견[/green]")
                 except Exception as e:
-                    console.print(f"[yellow]경고: {target_path.name} 파싱 실패 - {e}[/yellow]")
-            
-            target_policies = list(dict.fromkeys(target_policies))
+                    console.print(f"[yellow]경고: {target_name} 파싱 실패 - {e}[/yellow]")
         
         # 정책 검증
         if len(target_policies) == 0:
@@ -220,14 +351,17 @@ def upload_files():
         # 리포트 저장 (날짜+시간으로 파일명 중복 방지)
         report_filename = datetime.now().strftime("%Y-%m-%d_%H%M%S") + "_validation_report.xlsx"
         report_path = upload_dir / report_filename
-        validation_results.to_excel(str(report_path), index=False, engine='openpyxl')
+        save_report(validation_results, str(report_path))
         
         # 결과 요약 생성
         summary = get_summary_dict(validation_results)
-        
-        # 세션에는 파일명·요약만 저장 (쿠키 4KB 제한 방지, 대용량 results 제외)
+
+        # 요약은 업로드 디렉터리에 JSON으로 저장하고 세션에는 파일명만 유지
+        # (status_counts가 커지면 서명 쿠키가 4KB를 넘을 수 있고, 세션 내용은
+        # 응답마다 재직렬화됨 — results를 세션에서 뺀 것과 같은 패턴)
+        with open(upload_dir / 'summary.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
         session['report_filename'] = report_filename
-        session['summary'] = summary
         
         return jsonify({
             'success': True,
@@ -237,8 +371,9 @@ def upload_files():
         
     except Exception as e:
         console.print(f"[red]오류 발생: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
         return jsonify({'error': f'처리 중 오류가 발생했습니다: {str(e)}'}), 500
 
 
@@ -262,9 +397,17 @@ def download_report():
 
 @app.route('/results')
 def show_results():
-    """결과 페이지 (요약만 세션에 있음, 상세는 리포트 다운로드로 확인)"""
-    summary = session.get('summary')
+    """결과 페이지 (요약은 업로드 디렉터리의 summary.json에서 로드, 상세는 리포트 다운로드로 확인)"""
     report_filename = session.get('report_filename')
+    summary = None
+    if report_filename:
+        summary_path = get_upload_dir() / 'summary.json'
+        if summary_path.exists():
+            try:
+                with open(summary_path, encoding='utf-8') as f:
+                    summary = json.load(f)
+            except Exception:
+                summary = None
     if not summary or not report_filename:
         return render_template('index.html', error='검증 결과가 없습니다.')
     return render_template('index.html', summary_only=summary, report_filename=report_filename)
@@ -290,5 +433,14 @@ if __name__ == '__main__':
     
     console.print("[bold green]방화벽 정책 검증 웹 애플리케이션 시작[/bold green]")
     console.print("[cyan]로컬 접속: http://127.0.0.1:5000[/cyan]\n")
-    
-    app.run(host='127.0.0.1', port=5000, debug=True)
+
+    # 기본은 waitress (멀티스레드, 리로더/디버거 오버헤드 없음),
+    # 개발 시에는 VALIDATE_POLICY_DEBUG=1 로 werkzeug 개발 서버 사용
+    if _DEBUG:
+        app.run(host='127.0.0.1', port=5000, debug=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host='127.0.0.1', port=5000, threads=8)
+        except ImportError:
+            app.run(host='127.0.0.1', port=5000, debug=False)
@@ -28,7 +28,16 @@ def _log_error():
 def main():
     try:
         from app import app
-        app.run(host='127.0.0.1', port=5000, debug=False)
+        # 프로덕션 WSGI 서버로 실행: werkzeug 개발 서버는 단일 스레드라
+        # 업로드가 직렬화되고 요청당 오버헤드도 큼. waitress는 스레드 풀로
+        # 동시 업로드의 파일 I/O와 파싱을 겹쳐 처리함.
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host='127.0.0.1', port=5000, debug=False)
+            return
+        print('로컬 접속: http://127.0.0.1:5000')
+        serve(app, host='127.0.0.1', port=5000, threads=8)
     except Exception:
         _log_error()
         sys.exit(1)